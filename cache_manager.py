@@ -3,18 +3,62 @@
 
 import os
 import shutil
+import sys
 from pathlib import Path
 
 
+def _scan_directory(path):
+    """Yield (path, size) for each entry in path; size is None for subdirectories."""
+    with os.scandir(path) as it:
+        for entry in it:
+            try:
+                # d_type from readdir answers is_dir() without an extra stat
+                if entry.is_dir(follow_symlinks=False):
+                    size = None
+                else:
+                    size = entry.stat(follow_symlinks=False).st_size
+            except OSError:
+                continue
+            yield entry.path, size
+
+
+def walk_sizes(root, unreadable=None):
+    """Get the cumulative size in bytes of root and every directory below it.
+    
+    Directories that can't be scanned count as empty and, if an `unreadable`
+    list is given, are appended to it.
+    """
+    root = os.path.normpath(root)
+    sizes = {}
+    parents = {}
+    order = []
+    stack = [root]
+    while stack:
+        current = stack.pop()
+        order.append(current)
+        sizes[current] = 0
+        try:
+            for entry_path, size in _scan_directory(current):
+                if size is None:
+                    parents[entry_path] = current
+                    stack.append(entry_path)
+                else:
+                    sizes[current] += size
+        except OSError:
+            if unreadable is not None:
+                unreadable.append(current)
+            continue
+    
+    # Children are always visited after their parent, so bubble up in reverse
+    for path in reversed(order):
+        if path in parents:
+            sizes[parents[path]] += sizes[path]
+    return sizes
+
+
 def get_directory_size(path):
-    """Get the size of a directory in bytes."""
-    total = 0
-    for entry in os.scandir(path):
-        if entry.is_file():
-            total += entry.stat().st_size
-        elif entry.is_dir():
-            total += get_directory_size(entry.path)
-    return total
+    """Get the size of a directory in bytes (0 if it doesn't exist)."""
+    return walk_sizes(path)[os.path.normpath(path)]
 
 
 def format_size(size_bytes):
@@ -28,8 +72,8 @@ def format_size(size_bytes):
 
 def analyze_cache():
     """Analyze current cache usage."""
-    print("F1 Dashboard Cache Analysis")
-    print("=" * 40)
+    # Collect the report and write it in one go rather than a print per line
+    out = ["F1 Dashboard Cache Analysis", "=" * 40]
     
     cache_dirs = [
         'cache',
@@ -38,29 +82,34 @@ def analyze_cache():
     ]
     
     total_size = 0
+    sizes = {}
+    unreadable = []
     
-    for cache_dir in cache_dirs:
+    for cache_dir in dict.fromkeys(cache_dirs):
         if os.path.exists(cache_dir):
-            size = get_directory_size(cache_dir)
+            cache_dir = os.path.normpath(cache_dir)
+            if cache_dir not in sizes:
+                sizes.update(walk_sizes(cache_dir, unreadable))
+            size = sizes[cache_dir]
             total_size += size
-            print(f"{cache_dir}: {format_size(size)}")
+            out.append(f"{cache_dir}: {format_size(size)}")
             
-            # Show top-level subdirectories
-            try:
-                for item in sorted(os.listdir(cache_dir)):
-                    item_path = os.path.join(cache_dir, item)
-                    if os.path.isdir(item_path):
-                        item_size = get_directory_size(item_path)
-                        print(f"  └── {item}: {format_size(item_size)}")
-            except PermissionError:
-                print(f"  └── (Permission denied)")
+            # Show top-level subdirectories, straight from the walk (no re-scan)
+            if cache_dir in unreadable:
+                out.append(f"  └── (Permission denied)")
+                continue
+            subdirs = sorted(path for path in sizes if os.path.dirname(path) == cache_dir)
+            for item_path in subdirs:
+                out.append(f"  └── {os.path.basename(item_path)}: {format_size(sizes[item_path])}")
     
-    print(f"\nTotal cache size: {format_size(total_size)}")
+    out.append(f"\nTotal cache size: {format_size(total_size)}")
     
     # Show dashboard cache file
     if os.path.exists('dashboard_data.json'):
         dashboard_size = os.path.getsize('dashboard_data.json')
-        print(f"Dashboard cache: {format_size(dashboard_size)}")
+        out.append(f"Dashboard cache: {format_size(dashboard_size)}")
+    
+    sys.stdout.write("\n".join(out) + "\n")
 
 
 def clean_old_cache():
@@ -1,12 +1,13 @@
 """Background data polling and caching system."""
 
-import json
+import mmap
 import os
 import threading
 import time
-from datetime import datetime, timedelta
-from typing import Dict, Any, Optional
+from datetime import datetime
+from typing import Dict, Any, Optional, Tuple
 import logging
+import orjson
 from src.data import F1DataFetcher
 from config.settings import CACHE_FILE,POLL_INTERVAL_HOURS
 
@@ -15,17 +16,28 @@ logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
 
+def json_default(obj: Any) -> str:
+    """Serialize types orjson doesn't handle natively (e.g. pandas Timestamps)."""
+    return obj.isoformat() if hasattr(obj, 'isoformat') else str(obj)
+
+
 class F1DataCache:
     """Manages cached F1 data with background polling."""
     
     def __init__(self, cache_file: str = CACHE_FILE, poll_interval_hours: int = POLL_INTERVAL_HOURS):
         self.cache_file = cache_file
-        self.poll_interval = timedelta(hours=poll_interval_hours)
+        self._poll_seconds = poll_interval_hours * 3600
         self.data_fetcher = F1DataFetcher()
         self.cached_data: Optional[Dict[str, Any]] = None
         self.last_update: Optional[datetime] = None
+        # Monotonic-clock twin of last_update, so age checks survive wall-clock jumps
+        self._last_update_mono: Optional[float] = None
         self.update_in_progress = False
-        self.stop_polling = False
+        self._stop_event = threading.Event()
+        
+        # (last_update, processed copy of cached_data) handed out by get_data; one
+        # tuple so request threads never pair a view with another update's key
+        self._view_cache: Optional[Tuple[datetime, Dict[str, Any]]] = None
         
         # Load existing cache
         self.load_cache()
@@ -43,40 +55,54 @@ class F1DataCache:
     def load_cache(self) -> None:
         """Load cached data from disk."""
         try:
-            if os.path.exists(self.cache_file):
-                with open(self.cache_file, 'r') as f:
-                    cache_content = json.load(f)
-                    self.cached_data = cache_content.get('data')
-                    last_update_str = cache_content.get('last_update')
-                    if last_update_str:
-                        self.last_update = datetime.fromisoformat(last_update_str)
-                        logger.info(f"Loaded cached data from {last_update_str}")
-                    
-                    # Convert datetime strings back to datetime objects in the loaded data
-                    if self.cached_data and 'last_updated' in self.cached_data:
-                        if isinstance(self.cached_data['last_updated'], str):
-                            self.cached_data['last_updated'] = datetime.fromisoformat(self.cached_data['last_updated'])
-            else:
-                logger.info("No existing cache found")
+            # Parse straight from the mapped file, without an intermediate copy
+            with open(self.cache_file, 'rb') as f, \
+                    mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm, \
+                    memoryview(mm) as buf:
+                cache_content = orjson.loads(buf)
+            
+            self.cached_data = cache_content.get('data')
+            last_update_str = cache_content.get('last_update')
+            if last_update_str:
+                self.last_update = datetime.fromisoformat(last_update_str)
+                cache_age = (datetime.now() - self.last_update).total_seconds()
+                self._last_update_mono = time.monotonic() - cache_age
+                logger.info(f"Loaded cached data from {last_update_str}")
+            
+            # Parse the data's timestamp once, reusing last_update when it's the same instant
+            if self.cached_data and self.cached_data.get('last_updated'):
+                last_updated_str = self.cached_data['last_updated']
+                if last_updated_str == last_update_str:
+                    self.cached_data['last_updated'] = self.last_update
+                else:
+                    self.cached_data['last_updated'] = datetime.fromisoformat(last_updated_str)
+        except FileNotFoundError:
+            logger.info("No existing cache found")
         except Exception as e:
             logger.error(f"Error loading cache: {e}")
             self.cached_data = None
             self.last_update = None
+            self._last_update_mono = None
     
     def save_cache(self, data: Dict[str, Any]) -> None:
         """Save data to cache file."""
         try:
             cache_content = {
                 'data': data,
-                'last_update': datetime.now().isoformat()
+                'last_update': data.get('last_updated') or datetime.now()
             }
             
+            payload = orjson.dumps(cache_content, default=json_default)
+            
             # Write to temporary file first, then rename (atomic operation)
             temp_file = f"{self.cache_file}.tmp"
-            with open(temp_file, 'w') as f:
-                json.dump(cache_content, f, indent=2, default=str)
+            with open(temp_file, 'wb') as f:
+                # Buffered write() retries short writes and raises on failure (e.g. disk full)
+                f.write(payload)
+                f.flush()
+                os.fsync(f.fileno())
             
-            os.rename(temp_file, self.cache_file)
+            os.replace(temp_file, self.cache_file)
             logger.info(f"Saved cache to {self.cache_file}")
             
         except Exception as e:
@@ -150,7 +176,9 @@ class F1DataCache:
             
             # Update cache
             self.cached_data = fresh_data
-            self.last_update = datetime.now()
+            self.last_update = fresh_data['last_updated']
+            self._last_update_mono = time.monotonic()
+            self._view_cache = None
             
             # Save to disk
             self.save_cache(fresh_data)
@@ -180,60 +208,66 @@ class F1DataCache:
                 'error': 'Unable to fetch F1 data'
             }
         
+        # Snapshot the key before the data: update_data swaps cached_data first, so a
+        # racing update can only pair newer data with an older key (forcing a rebuild),
+        # never stale data with the new key
+        key = self.last_update
+        cached = self.cached_data
+        
+        # Data only changes on update, so reuse the view built for this update
+        view_cache = self._view_cache
+        if view_cache is not None and view_cache[0] == key:
+            return view_cache[1]
+        
         # Make a copy and ensure datetime objects are properly handled
-        data = self.cached_data.copy()
+        data = cached.copy()
         
-        # Convert string datetimes back to datetime objects for template
-        if 'last_updated' in data and isinstance(data['last_updated'], str):
-            data['last_updated'] = datetime.fromisoformat(data['last_updated'])
-        elif 'last_updated' not in data:
-            data['last_updated'] = self.last_update or datetime.now()
+        # last_updated is already a datetime (parsed once in load_cache); fill it if missing
+        if 'last_updated' not in data:
+            data['last_updated'] = key or datetime.now()
         
+        self._view_cache = (key, data)
         return data
     
     def should_update(self) -> bool:
         """Check if data should be updated based on age."""
-        if self.last_update is None:
-            return True
-        
-        age = datetime.now() - self.last_update
-        return age >= self.poll_interval
+        return (self._last_update_mono is None or
+                time.monotonic() - self._last_update_mono >= self._poll_seconds)
     
     def _polling_loop(self) -> None:
         """Background polling loop."""
         logger.info("Background polling started")
         
         # Initial delay before first poll (let the server start up first)
-        time.sleep(30)  # 30 seconds
+        self._stop_event.wait(30)  # 30 seconds
         
-        while not self.stop_polling:
+        while not self._stop_event.is_set():
             try:
                 if self.should_update():
                     logger.info("Scheduled data update starting...")
                     self.update_data()
                 
-                # Sleep in small chunks so we can stop quickly if needed
-                for _ in range(300):  # Check every 5 minutes if we should poll
-                    if self.stop_polling:
-                        break
-                    time.sleep(60)  # 1 minute
+                # Block until the next poll is due; stop() wakes us immediately
+                if self._stop_event.wait(self._poll_seconds):
+                    break
                     
             except Exception as e:
                 logger.error(f"Error in polling loop: {e}")
-                time.sleep(300)  # Wait 5 minutes before retrying
+                self._stop_event.wait(300)  # Wait 5 minutes before retrying
         
         logger.info("Background polling stopped")
     
     def stop(self) -> None:
         """Stop background polling."""
         logger.info("Stopping background polling...")
-        self.stop_polling = True
+        self._stop_event.set()
         if self.polling_thread.is_alive():
             self.polling_thread.join(timeout=5)
     
     def force_update(self) -> None:
         """Force an immediate data update."""
         logger.info("Forcing immediate data update...")
+        self.data_fetcher.clear_schedule_cache()
         self.update_data()
     
     def get_cache_status(self) -> Dict[str, Any]:
@@ -1,12 +1,50 @@
 """Data fetching and processing module for F1 information."""
 
 import fastf1
+import functools
 import os
+import time
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from typing import Dict, List, Optional, Any
+import numpy as np
 import pandas as pd
+from fastf1.ergast import Ergast
 from config.settings import CACHE_DIRECTORY
 
+MEANINGFUL_SESSIONS = ['Sprint Qualifying', 'Sprint', 'Qualifying', 'Race']
+CANDIDATE_SESSION_COLUMNS = [
+    ('Session2', 'Session2DateUtc'),
+    ('Session3', 'Session3DateUtc'),
+    ('Session4', 'Session4DateUtc'),
+    ('Session5', 'Session5DateUtc')
+]
+SESSION_DATE_COLUMNS = ['Session1DateUtc', 'Session2DateUtc', 'Session3DateUtc', 'Session4DateUtc', 'Session5DateUtc']
+
+
+@functools.lru_cache(maxsize=4)
+def _cached_race_events(year: int, day_key: int) -> pd.DataFrame:
+    """Get a season's non-testing events with session dates as UTC timestamps.
+    
+    Cached per (year, day) so one poll shares a single schedule fetch. The
+    returned frame is shared between callers and must not be modified.
+    """
+    schedule = fastf1.get_event_schedule(year)
+    race_events = schedule[schedule['EventFormat'] != 'testing'].copy()
+    return _to_utc(race_events, SESSION_DATE_COLUMNS)
+
+
+def _to_utc(df: pd.DataFrame, cols: List[str]) -> pd.DataFrame:
+    """Convert the given columns to timezone-aware UTC timestamps in one assignment."""
+    df[cols] = df[cols].apply(pd.to_datetime, utc=True)
+    return df
+
+
+def _upcoming_events(race_events: pd.DataFrame, now: pd.Timestamp) -> pd.DataFrame:
+    """Filter to events that have any session after now."""
+    mask = race_events[SESSION_DATE_COLUMNS].gt(now).to_numpy().any(axis=1)
+    return race_events[mask]
+
 
 class F1DataFetcher:
     """Handles fetching and processing F1 data using fastf1."""
@@ -25,78 +63,72 @@ class F1DataFetcher:
     def _current_year(self) -> int:
         """Get the current season year at call time."""
         return datetime.now().year
+
+    def _get_race_events(self, year: int) -> pd.DataFrame:
+        """Get a season's race events, refreshed at most once a day."""
+        return _cached_race_events(year, datetime.now().date().toordinal())
+
+    def clear_schedule_cache(self) -> None:
+        """Drop memoized schedules so the next lookup fetches them again."""
+        _cached_race_events.cache_clear()
     
     def get_next_event(self) -> Optional[Dict[str, Any]]:
         """Get information about the next F1 event."""
         try:
             # Get the schedule for current year
             current_year = self._current_year()
-            schedule = fastf1.get_event_schedule(current_year)
-            
-            # Filter out testing events and keep only race events
-            race_events = schedule[schedule['EventFormat'] != 'testing'].copy()
+            race_events = self._get_race_events(current_year)
             
             if race_events.empty:
                 return None
             
-            # Convert all session datetime columns to timezone-aware timestamps
-            session_cols = ['Session1DateUtc', 'Session2DateUtc', 'Session3DateUtc', 'Session4DateUtc', 'Session5DateUtc']
-            for col in session_cols:
-                race_events[col] = pd.to_datetime(race_events[col], utc=True)
-            
             # Filter for events that have any upcoming sessions
             now = pd.Timestamp.now(tz='UTC')
-            upcoming_events = race_events[
-                (race_events['Session1DateUtc'] > now) | 
-                (race_events['Session2DateUtc'] > now) | 
-                (race_events['Session3DateUtc'] > now) | 
-                (race_events['Session4DateUtc'] > now) | 
-                (race_events['Session5DateUtc'] > now)
-            ]
+            upcoming_events = _upcoming_events(race_events, now)
             
             if upcoming_events.empty:
                 # Try next year if no events left this year
                 try:
-                    schedule = fastf1.get_event_schedule(current_year + 1)
-                    race_events = schedule[schedule['EventFormat'] != 'testing'].copy()
+                    race_events = self._get_race_events(current_year + 1)
                     
                     if not race_events.empty:
-                        # Convert all session datetime columns
-                        for col in session_cols:
-                            race_events[col] = pd.to_datetime(race_events[col], utc=True)
-                        
-                        upcoming_events = race_events[
-                            (race_events['Session1DateUtc'] > now) | 
-                            (race_events['Session2DateUtc'] > now) | 
-                            (race_events['Session3DateUtc'] > now) | 
-                            (race_events['Session4DateUtc'] > now) | 
-                            (race_events['Session5DateUtc'] > now)
-                        ]
+                        upcoming_events = _upcoming_events(race_events, now)
                 except:
                     return None
             
             if upcoming_events.empty:
                 return None
             
-            # Find the event with the next meaningful session
-            next_event_info = None
-            earliest_session_time = None
+            # Events x sessions grids of names and (naive UTC) times for sessions 2-5
+            names = upcoming_events[[name_col for name_col, _ in CANDIDATE_SESSION_COLUMNS]].to_numpy()
+            times = np.column_stack([
+                upcoming_events[date_col].dt.tz_convert(None).to_numpy()
+                for _, date_col in CANDIDATE_SESSION_COLUMNS
+            ])
+            
+            # Sessions we care about that haven't happened yet (NaT compares False)
+            mask = np.isin(names, MEANINGFUL_SESSIONS) & (times > now.tz_convert(None).to_datetime64())
+            candidates = np.flatnonzero(mask)
             
-            for _, event in upcoming_events.iterrows():
-                session_info = self._get_next_session_info(event, now)
-                if session_info and session_info['session_time_utc']:
-                    if earliest_session_time is None or session_info['session_time_utc'] < earliest_session_time:
-                        earliest_session_time = session_info['session_time_utc']
-                        next_event_info = {
-                            'name': event['EventName'],
-                            'location': f"{event['Location']}, {event['Country']}",
-                            'date': session_info['date'],
-                            'time': session_info['time'],
-                            'type': session_info['type'],
-                            'round': int(event['RoundNumber'])
-                        }
+            if candidates.size == 0:
+                return None
+            
+            # Earliest candidate session; argmin keeps the first, so ties go to the earlier event
+            row, col = divmod(candidates[np.argmin(times.ravel()[candidates])], times.shape[1])
+            event = upcoming_events.iloc[row]
+            session_time_utc = pd.Timestamp(times[row, col], tz='UTC')
             
-            return next_event_info
+            # Convert from UTC to local timezone
+            session_time_local = session_time_utc.tz_convert(self.local_tz)
+            
+            return {
+                'name': event['EventName'],
+                'location': f"{event['Location']}, {event['Country']}",
+                'date': session_time_local.strftime('%Y-%m-%d'),
+                'time': session_time_local.strftime('%I:%M %p %Z'),
+                'type': names[row, col],
+                'round': int(event['RoundNumber'])
+            }
             
         except Exception as e:
             print(f"Error fetching next event: {e}")
@@ -104,68 +136,16 @@ class F1DataFetcher:
             traceback.print_exc()
             return None
     
-    def _get_next_session_info(self, event: pd.Series, now: pd.Timestamp) -> Optional[Dict[str, Any]]:
-        """Determine the next meaningful session for an event (Sprint Qualifying, Sprint, Qualifying, or Race)."""
-        
-        # Define sessions we care about - check each session number and its corresponding date column
-        sessions_to_check = [
-            ('Session2', 'Session2DateUtc'),
-            ('Session3', 'Session3DateUtc'), 
-            ('Session4', 'Session4DateUtc'),
-            ('Session5', 'Session5DateUtc')
-        ]
-        
-        # Find all upcoming meaningful sessions for this event
-        upcoming_sessions = []
-        
-        for session_name_col, session_date_col in sessions_to_check:
-            session_name = event.get(session_name_col, '')
-            
-            # Check if this session is one we care about and hasn't happened yet
-            if (session_name in ['Sprint Qualifying', 'Sprint', 'Qualifying', 'Race'] and 
-                pd.notna(event[session_date_col]) and 
-                event[session_date_col] > now):
-                
-                upcoming_sessions.append({
-                    'name': session_name,
-                    'time_utc': event[session_date_col]
-                })
-        
-        # If no upcoming meaningful sessions, return None
-        if not upcoming_sessions:
-            return None
-            
-        # Sort by time and get the earliest one
-        upcoming_sessions.sort(key=lambda x: x['time_utc'])
-        next_session = upcoming_sessions[0]
-        
-        # Convert from UTC to local timezone
-        session_time_local = next_session['time_utc'].tz_convert(self.local_tz)
-        
-        return {
-            'date': session_time_local.strftime('%Y-%m-%d'),
-            'time': session_time_local.strftime('%I:%M %p %Z'),
-            'type': next_session['name'],
-            'session_time_utc': next_session['time_utc']  # Include for sorting in parent method
-        }
-    
     def get_current_standings(self) -> Dict[str, List[Dict[str, Any]]]:
         """Get current driver and constructor standings."""
         try:
             # Only look at current year for standings
             current_year = self._current_year()
-            schedule = fastf1.get_event_schedule(current_year)
-            
-            # Filter out testing events
-            race_events = schedule[schedule['EventFormat'] != 'testing'].copy()
+            race_events = self._get_race_events(current_year)
             
             if race_events.empty:
                 return {'drivers': [], 'constructors': []}
             
-            # Convert datetime columns (only qualifying and race)
-            for col in ['Session4DateUtc', 'Session5DateUtc']:
-                race_events[col] = pd.to_datetime(race_events[col], utc=True)
-            
             now = pd.Timestamp.now(tz='UTC')
             
             # Get completed races (where race has finished)
@@ -178,12 +158,14 @@ class F1DataFetcher:
             
             print(f"  Found {len(completed_races)} completed races this season")
             
-            # Initialize points dictionaries
-            driver_points = {}
-            constructor_points = {}
+            # Ergast serves the aggregated championship standings in a single request
+            try:
+                return self._get_ergast_standings(current_year)
+            except Exception as e:
+                print(f"  Ergast standings unavailable ({e}), summing race results instead")
             
-            # Load results from ALL completed races and sum points
-            for _, race in completed_races.iterrows():
+            # Load results from ALL completed races; each load is network-bound, so overlap them
+            def load_results(race: Dict[str, Any]) -> Optional[pd.DataFrame]:
                 try:
                     print(f"  Loading results from {race['EventName']}...")
                     session = fastf1.get_session(current_year, race['RoundNumber'], 'R')
@@ -191,54 +173,39 @@ class F1DataFetcher:
                     # Only load results data - NOT full telemetry (this saves hundreds of MB per race)
                     session.load(laps=False, telemetry=False, weather=False, messages=False)
                     
+                    # Stay polite to the API even when loading in parallel
+                    time.sleep(0.2)
+                    
                     results = session.results
+                    return None if results.empty else results[['FullName', 'TeamName', 'Points']]
                     
-                    if not results.empty:
-                        # Add points for each driver
-                        for _, result in results.iterrows():
-                            driver_name = result['FullName']
-                            team_name = result['TeamName']
-                            race_points = result['Points'] if pd.notna(result['Points']) else 0
-                            
-                            # Sum driver points
-                            if driver_name in driver_points:
-                                driver_points[driver_name] += race_points
-                            else:
-                                driver_points[driver_name] = race_points
-                            
-                            # Sum constructor points
-                            if team_name in constructor_points:
-                                constructor_points[team_name] += race_points
-                            else:
-                                constructor_points[team_name] = race_points
-                                
                 except Exception as e:
                     print(f"    Error loading {race['EventName']}: {e}")
-                    continue
+                    return None
             
-            # Sort and create standings lists
-            driver_standings = []
-            constructor_standings = []
+            with ThreadPoolExecutor(max_workers=6) as executor:
+                frames = [
+                    results for results in executor.map(load_results, completed_races.to_dict('records'))
+                    if results is not None
+                ]
             
-            # Sort drivers by points (descending)
-            sorted_drivers = sorted(driver_points.items(), key=lambda x: x[1], reverse=True)
-            for driver, points in sorted_drivers[:3]:
-                driver_standings.append({
-                    'name': driver,
-                    'points': int(points)
-                })
+            if not frames:
+                return {'drivers': [], 'constructors': []}
             
-            # Sort constructors by points (descending)
-            sorted_constructors = sorted(constructor_points.items(), key=lambda x: x[1], reverse=True)
-            for constructor, points in sorted_constructors[:3]:
-                constructor_standings.append({
-                    'name': constructor,
-                    'points': int(points)
-                })
+            # Sum points across all races in one pass per grouping
+            all_results = pd.concat(frames, ignore_index=True).fillna({'Points': 0})
+            driver_points = all_results.groupby('FullName', sort=False)['Points'].sum().nlargest(3)
+            constructor_points = all_results.groupby('TeamName', sort=False)['Points'].sum().nlargest(3)
             
             return {
-                'drivers': driver_standings,
-                'constructors': constructor_standings
+                'drivers': [
+                    {'name': driver, 'points': int(points)}
+                    for driver, points in driver_points.items()
+                ],
+                'constructors': [
+                    {'name': constructor, 'points': int(points)}
+                    for constructor, points in constructor_points.items()
+                ]
             }
             
         except Exception as e:
@@ -247,50 +214,42 @@ class F1DataFetcher:
             traceback.print_exc()
             return {'drivers': [], 'constructors': []}
     
+    def _get_ergast_standings(self, year: int) -> Dict[str, List[Dict[str, Any]]]:
+        """Get the top 3 drivers and constructors from the Ergast championship standings."""
+        ergast = Ergast()
+        drivers = ergast.get_driver_standings(season=year).content[0].nlargest(3, 'points')
+        constructors = ergast.get_constructor_standings(season=year).content[0].nlargest(3, 'points')
+        
+        return {
+            'drivers': [
+                {'name': f"{given_name} {family_name}", 'points': int(points)}
+                for given_name, family_name, points
+                in zip(drivers['givenName'], drivers['familyName'], drivers['points'])
+            ],
+            'constructors': [
+                {'name': name, 'points': int(points)}
+                for name, points in zip(constructors['constructorName'], constructors['points'])
+            ]
+        }
+    
     def get_event_after_next(self) -> Optional[Dict[str, Any]]:
         """Get information about the event after next."""
         try:
             # Get the schedule for current year
             current_year = self._current_year()
-            schedule = fastf1.get_event_schedule(current_year)
-            
-            # Filter out testing events
-            race_events = schedule[schedule['EventFormat'] != 'testing'].copy()
-            
-            if not race_events.empty:
-                # Convert all session datetime columns
-                session_cols = ['Session1DateUtc', 'Session2DateUtc', 'Session3DateUtc', 'Session4DateUtc', 'Session5DateUtc']
-                for col in session_cols:
-                    race_events[col] = pd.to_datetime(race_events[col], utc=True)
+            race_events = self._get_race_events(current_year)
             
             # Filter for events that have any upcoming sessions
             now = pd.Timestamp.now(tz='UTC')
-            upcoming_events = race_events[
-                (race_events['Session1DateUtc'] > now) | 
-                (race_events['Session2DateUtc'] > now) | 
-                (race_events['Session3DateUtc'] > now) | 
-                (race_events['Session4DateUtc'] > now) | 
-                (race_events['Session5DateUtc'] > now)
-            ] if not race_events.empty else pd.DataFrame()
+            upcoming_events = _upcoming_events(race_events, now) if not race_events.empty else pd.DataFrame()
             
             if len(upcoming_events) < 2:
                 # Try next year if not enough events left
                 try:
-                    next_year_schedule = fastf1.get_event_schedule(current_year + 1)
-                    next_year_races = next_year_schedule[next_year_schedule['EventFormat'] != 'testing'].copy()
+                    next_year_races = self._get_race_events(current_year + 1)
                     
                     if not next_year_races.empty:
-                        # Convert all session datetime columns
-                        for col in session_cols:
-                            next_year_races[col] = pd.to_datetime(next_year_races[col], utc=True)
-                        
-                        next_year_upcoming = next_year_races[
-                            (next_year_races['Session1DateUtc'] > now) | 
-                            (next_year_races['Session2DateUtc'] > now) | 
-                            (next_year_races['Session3DateUtc'] > now) | 
-                            (next_year_races['Session4DateUtc'] > now) | 
-                            (next_year_races['Session5DateUtc'] > now)
-                        ]
+                        next_year_upcoming = _upcoming_events(next_year_races, now)
                         upcoming_events = pd.concat([upcoming_events, next_year_upcoming])
                 except:
                     pass
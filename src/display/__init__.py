@@ -1,9 +1,38 @@
 """Display module for rendering F1 dashboard."""
 
 from abc import ABC, abstractmethod
-from typing import Any
-from flask import Flask, render_template, jsonify
-from datetime import datetime
+from pathlib import Path
+import time
+from typing import Any, Callable, Dict, Optional, Tuple
+from fastapi import FastAPI, Request
+from fastapi.middleware.gzip import GZipMiddleware
+from fastapi.responses import HTMLResponse, Response
+from fastapi.staticfiles import StaticFiles
+from jinja2 import Environment, FileSystemLoader, select_autoescape
+import orjson
+import uvicorn
+from src.cache import json_default
+
+
+BASE_DIR = Path(__file__).resolve().parents[2]
+
+
+def _dumps(obj: Any) -> bytes:
+    """Serialize obj to JSON bytes with orjson."""
+    return orjson.dumps(obj, default=json_default, option=orjson.OPT_SERIALIZE_NUMPY)
+
+
+def _etag_matches(if_none_match: str, etag: str) -> bool:
+    """Check an If-None-Match header value against a quoted ETag (weak tags match too)."""
+    if not if_none_match:
+        return False
+    for candidate in if_none_match.split(','):
+        candidate = candidate.strip()
+        if candidate.startswith('W/'):
+            candidate = candidate[2:]
+        if candidate in (etag, '*'):
+            return True
+    return False
 
 
 class DisplayBase(ABC):
@@ -16,59 +45,125 @@ class DisplayBase(ABC):
 
 
 class WebDisplay(DisplayBase):
-    """Web-based display using Flask with cached data."""
+    """Web-based display using FastAPI with cached data."""
     
     def __init__(self, port: int = 5000):
         """Initialize web display."""
         self.port = port
-        self.app = Flask(__name__, 
-                        template_folder='../../templates',
-                        static_folder='../../static')
+        self.app = FastAPI()
+        self.app.mount('/static', StaticFiles(directory=BASE_DIR / 'static'), name='static')
+        
+        # Gzip the repetitive JSON and HTML; level 4 keeps most of level 9's ratio for far less CPU
+        self.app.add_middleware(GZipMiddleware, minimum_size=500, compresslevel=4)
+        
+        # Templates ship with the app; skip the per-request reload check
+        self.jinja_env = Environment(loader=FileSystemLoader(BASE_DIR / 'templates'),
+                                     autoescape=select_autoescape(['html']),
+                                     auto_reload=False)
+        self.jinja_env.globals['url_for'] = self._url_for
+        
         self.data_cache = None
+        # Route name -> (cache last_update, serialized payload)
+        self._blob_cache: Dict[str, Tuple[Any, bytes]] = {}
+        # Serialized cache status, reused until the monotonic expiry passes
+        self._status_blob: Optional[bytes] = None
+        self._status_expiry = 0.0
         self._setup_routes()
     
+    def _url_for(self, name: str, filename: str) -> str:
+        """Template helper mirroring Flask's url_for('static', filename=...)."""
+        return self.app.url_path_for(name, path=filename)
+    
+    def _json_response(self, data: bytes, status_code: int = 200) -> Response:
+        """Wrap pre-serialized JSON bytes in a response, skipping re-serialization."""
+        return Response(data, status_code=status_code, media_type='application/json')
+    
+    def _cached_json_response(self, request: Request, name: str,
+                              build: Callable[[], Any]) -> Response:
+        """Serve build() as JSON, serialized once per data update and tagged with an ETag.
+        
+        The cache's last_update is both the serialized-payload key and the ETag, so
+        clients revalidating with If-None-Match get a bodiless 304 until new data lands.
+        """
+        # Read the key before building so an update landing mid-build just forces a redo
+        key = self.data_cache.last_update
+        if key is None:
+            # Nothing cached yet; let get_data keep retrying the fetch on each request
+            return self._json_response(_dumps(build()))
+        
+        etag = f'"{key.isoformat()}"'
+        if _etag_matches(request.headers.get('if-none-match'), etag):
+            response = Response(status_code=304)
+        else:
+            cached = self._blob_cache.get(name)
+            if cached is None or cached[0] != key:
+                cached = (key, _dumps(build()))
+                self._blob_cache[name] = cached
+            response = self._json_response(cached[1])
+        
+        response.headers['ETag'] = etag
+        response.headers['Cache-Control'] = 'private, must-revalidate'
+        return response
+    
     def _setup_routes(self):
-        """Setup Flask routes."""
-        @self.app.after_request
-        def add_no_cache_headers(response):
+        """Setup FastAPI routes."""
+        @self.app.middleware('http')
+        async def add_no_cache_headers(request: Request, call_next):
+            response = await call_next(request)
+            # Handlers that set their own caching policy (the ETag-revalidated JSON) keep it;
+            # everything else, static assets included, is never stored
+            if 'cache-control' in response.headers:
+                return response
             response.headers['Cache-Control'] = 'no-store, no-cache, must-revalidate, max-age=0'
             response.headers['Pragma'] = 'no-cache'
             response.headers['Expires'] = '0'
             return response
 
-        @self.app.route('/')
+        # Compile the dashboard template once instead of looking it up per request
+        dashboard_template = self.jinja_env.get_template('dashboard.html')
+
+        # Plain (sync) handlers run in the threadpool, since get_data can block on a fetch
+        @self.app.get('/', response_class=HTMLResponse)
         def dashboard():
             dashboard_data = self.data_cache.get_data()
-            return render_template('dashboard.html', **dashboard_data)
+            return HTMLResponse(dashboard_template.render(**dashboard_data))
         
-        @self.app.route('/api/data')
-        def api_data():
-            return jsonify(self.data_cache.get_data())
+        @self.app.get('/api/data')
+        def api_data(request: Request):
+            return self._cached_json_response(request, 'data', self.data_cache.get_data)
         
-        @self.app.route('/api/dashboard-data')
-        def api_dashboard_data():
+        @self.app.get('/api/dashboard-data')
+        def api_dashboard_data(request: Request):
             """API endpoint for refresh - formats data for JavaScript"""
-            data = self.data_cache.get_data()
+            def build():
+                data = self.data_cache.get_data()
+                
+                # Format the data to match what the JavaScript expects; last_updated is
+                # always a datetime from the cache, and is formatted once per data update
+                return {
+                    'next_event': data.get('next_event'),
+                    'event_after_next': data.get('event_after_next'),
+                    'standings': data.get('standings'),
+                    'last_updated': data['last_updated'].strftime('%Y-%m-%d %H:%M:%S')
+                }
             
-            # Format the data to match what the JavaScript expects
-            return jsonify({
-                'next_event': data.get('next_event'),
-                'event_after_next': data.get('event_after_next'),
-                'standings': data.get('standings'),
-                'last_updated': data.get('last_updated').strftime('%Y-%m-%d %H:%M:%S')
-                if isinstance(data.get('last_updated'), datetime)
-                else data.get('last_updated')
-            })
-        
-        @self.app.route('/api/status')
+            return self._cached_json_response(request, 'dashboard-data', build)
+        
+        @self.app.get('/api/status')
         def api_status():
-            return jsonify(self.data_cache.get_cache_status())
+            # Cache age only moves meaningfully over minutes; a 1s-old status is fine for polling
+            now = time.monotonic()
+            if self._status_blob is None or now > self._status_expiry:
+                self._status_blob = _dumps(self.data_cache.get_cache_status())
+                self._status_expiry = now + 1.0
+            return self._json_response(self._status_blob)
         
-        @self.app.route('/api/refresh', methods=['POST'])
+        @self.app.post('/api/refresh')
         def api_refresh():
             """Force a data refresh."""
             self.data_cache.force_update()
-            return jsonify({'status': 'refresh_initiated'})
+            self._status_blob = None
+            return self._json_response(_dumps({'status': 'refresh_initiated'}))
     
     def render(self, data_cache: Any) -> None:
         """Start the web server with the data cache."""
@@ -84,10 +179,14 @@ class WebDisplay(DisplayBase):
         print("Press Ctrl+C to stop")
         
         try:
-            self.app.run(host='0.0.0.0', port=self.port, debug=False, threaded=True)
+            # One process: the data cache and its polling thread live in this interpreter.
+            # loop='auto' picks uvloop when it's installed (uvicorn[standard]).
+            uvicorn.run(self.app, host='0.0.0.0', port=self.port, loop='auto')
         except KeyboardInterrupt:
-            print("\nShutting down web server...")
-            data_cache.stop()
+            pass
+        # uvicorn handles Ctrl+C itself and returns once it has shut down
+        print("\nShutting down web server...")
+        data_cache.stop()
 
 
 class DesktopDisplay(DisplayBase):
@@ -101,38 +200,37 @@ class DesktopDisplay(DisplayBase):
         data = data_cache.get_data()
         cache_status = data_cache.get_cache_status()
         
-        print("Cache Status:")
-        print(f"  - Has cached data: {cache_status['has_cached_data']}")
-        print(f"  - Last update: {cache_status['last_update']}")
-        print(f"  - Cache age: {cache_status['cache_age_hours']} hours")
-        print(f"  - Update in progress: {cache_status['update_in_progress']}")
-        
-        print("\nData to display:")
+        print(f"Cache Status:\n"
+              f"  - Has cached data: {cache_status['has_cached_data']}\n"
+              f"  - Last update: {cache_status['last_update']}\n"
+              f"  - Cache age: {cache_status['cache_age_hours']} hours\n"
+              f"  - Update in progress: {cache_status['update_in_progress']}\n"
+              f"\nData to display:")
         
         if data.get('next_event'):
             event = data['next_event']
-            print(f"\nNext Event: {event['name']}")
-            print(f"Location: {event['location']}")
-            print(f"Date: {event['date']} at {event['time']}")
-            print(f"Type: {event['type']}")
+            print(f"\nNext Event: {event['name']}\n"
+                  f"Location: {event['location']}\n"
+                  f"Date: {event['date']} at {event['time']}\n"
+                  f"Type: {event['type']}")
         
         if data.get('standings') and data['standings']['drivers']:
             standings = data['standings']
-            print(f"\nTop 3 Drivers:")
-            for i, driver in enumerate(standings['drivers'][:3], 1):
-                print(f"  {i}. {driver['name']} - {driver['points']} pts")
-            
-            print(f"\nTop 3 Constructors:")
-            for i, constructor in enumerate(standings['constructors'][:3], 1):
-                print(f"  {i}. {constructor['name']} - {constructor['points']} pts")
+            lines = ["\nTop 3 Drivers:"]
+            lines.extend(f"  {i}. {driver['name']} - {driver['points']} pts"
+                         for i, driver in enumerate(standings['drivers'][:3], 1))
+            lines.append("\nTop 3 Constructors:")
+            lines.extend(f"  {i}. {constructor['name']} - {constructor['points']} pts"
+                         for i, constructor in enumerate(standings['constructors'][:3], 1))
+            print("\n".join(lines))
         else:
             print("\nNo standings data available (beginning of season)")
         
         if data.get('event_after_next'):
             event = data['event_after_next']
-            print(f"\nUpcoming: {event['name']}")
-            print(f"Location: {event['location']}")
-            print(f"Date: {event['date']}")
+            print(f"\nUpcoming: {event['name']}\n"
+                  f"Location: {event['location']}\n"
+                  f"Date: {event['date']}")
         
         if 'fetch_duration_minutes' in data and data['fetch_duration_minutes']:
             print(f"\nLast data fetch took: {data['fetch_duration_minutes']} minutes")
@@ -0,0 +1,38 @@
+"""Shared HTML rendering for the test dashboard pages."""
+
+import functools
+import pathlib
+from datetime import datetime
+
+from jinja2 import Environment, FileSystemLoader
+
+FIXTURES_DIR = pathlib.Path(__file__).parent / 'fixtures'
+
+
+@functools.lru_cache(maxsize=1)
+def _load_css(css_path):
+    """Read the dashboard CSS once; repeated page builds reuse it."""
+    path = pathlib.Path(css_path)
+    return path.read_text(encoding='utf-8') if path.exists() else ""
+
+
+@functools.lru_cache(maxsize=1)
+def _get_template():
+    """Compile the test dashboard template once."""
+    env = Environment(loader=FileSystemLoader(FIXTURES_DIR), autoescape=True, auto_reload=False)
+    return env.get_template('test_dashboard.html.j2')
+
+
+def render_test_dashboard(css_path, title, subtitle, next_event, standings,
+                          event_after_next=None, fullscreen_button=False):
+    """Render the test dashboard page to an HTML string."""
+    return _get_template().render(
+        css=_load_css(css_path),
+        title=title,
+        subtitle=subtitle,
+        generated_at=datetime.now().strftime('%Y-%m-%d %H:%M:%S'),
+        next_event=next_event,
+        standings=standings,
+        event_after_next=event_after_next,
+        fullscreen_button=fullscreen_button
+    )
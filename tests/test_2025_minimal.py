@@ -1,26 +1,8 @@
 """Test minimal data loading with 2025 season."""
 
-import os
 import fastf1
 from src.data import F1DataFetcher
-
-def get_directory_size(path):
-    total = 0
-    if not os.path.exists(path):
-        return 0
-    for entry in os.scandir(path):
-        if entry.is_file():
-            total += entry.stat().st_size
-        elif entry.is_dir():
-            total += get_directory_size(entry.path)
-    return total
-
-def format_size(size_bytes):
-    for unit in ['B', 'KB', 'MB', 'GB']:
-        if size_bytes < 1024.0:
-            return f"{size_bytes:.1f} {unit}"
-        size_bytes /= 1024.0
-    return f"{size_bytes:.1f} TB"
+from cache_manager import get_directory_size, format_size
 
 print("=== Testing with 2025 season (has completed races) ===")
 
@@ -4,9 +4,11 @@ Test script to simulate the F1 dashboard at a specific date.
 This simulates being between race 4 and 5 of the 2025 season.
 """
 
+import glob
 import os
 import sys
 import shutil
+import threading
 from datetime import datetime, timezone
 from unittest.mock import patch
 import pandas as pd
@@ -16,15 +18,34 @@ sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
 
 from data import F1DataFetcher
 from display import WebDisplay
+from dashboard_page import render_test_dashboard
+
+def _remove_trees(paths):
+    """Delete each directory tree in paths, ignoring errors."""
+    for path in paths:
+        shutil.rmtree(path, ignore_errors=True)
 
 def clear_cache():
     """Clear the existing cache to ensure fresh data."""
     cache_dir = '../cache'
+    # Trees left behind by earlier runs that were interrupted mid-delete
+    doomed = glob.glob(f"{cache_dir}.gc.*")
     if os.path.exists(cache_dir):
         print(f"Clearing cache directory: {cache_dir}")
-        shutil.rmtree(cache_dir)
+        # Renaming is instant; delete the old tree in the background while the test runs
+        doomed.append(f"{cache_dir}.gc.{os.urandom(4).hex()}")
+        os.rename(cache_dir, doomed[-1])
+    if doomed:
+        # Not a daemon, so the interpreter waits for the delete to finish before exiting
+        threading.Thread(target=_remove_trees, args=(doomed,)).start()
     os.makedirs(cache_dir, exist_ok=True)
 
+def _as_timestamp(value):
+    """Return value as a Timestamp, skipping the parse when it already is one."""
+    if isinstance(value, pd.Timestamp):
+        return value
+    return pd.to_datetime(value, format='ISO8601')
+
 def get_race_4_and_5_dates():
     """Get the dates for races 4 and 5 of 2025 to pick a date in between."""
     import fastf1
@@ -43,12 +64,15 @@ def get_race_4_and_5_dates():
             print(f"Race 4: {race_4['EventName']} - Race Date: {race_4['Session5DateUtc']}")
             print(f"Race 5: {race_5['EventName']} - Race Date: {race_5['Session5DateUtc']}")
             
-            # Convert to datetime objects
-            race_4_date = pd.to_datetime(race_4['Session5DateUtc'])
-            race_5_date = pd.to_datetime(race_5['Session5DateUtc'])
+            # FastF1 already returns Timestamps; only parse (with the fast ISO path) if not
+            race_4_date = _as_timestamp(race_4['Session5DateUtc'])
+            race_5_date = _as_timestamp(race_5['Session5DateUtc'])
             
-            # Pick a date in between (average of the two dates)
-            midpoint = race_4_date + (race_5_date - race_4_date) / 2
+            # Pick a date in between (average of the two dates), in integer datetime64[ns]
+            # math; to_datetime64 gives naive UTC, which is what FastF1's *Utc columns hold
+            t4 = race_4_date.to_datetime64().astype('datetime64[ns]')
+            t5 = race_5_date.to_datetime64().astype('datetime64[ns]')
+            midpoint = pd.Timestamp(t4 + (t5 - t4) // 2)
             
             return midpoint, race_4, race_5
         else:
@@ -115,87 +139,13 @@ def create_test_webpage(next_event, standings):
     """Create and save a test webpage with the results."""
     print("\n=== CREATING TEST WEBPAGE ===\n")
     
-    # Read the CSS file
-    css_content = ""
-    css_path = 'static/css/style.css'
-    if os.path.exists(css_path):
-        with open(css_path, 'r', encoding='utf-8') as f:
-            css_content = f.read()
-    
-    # Generate driver standings HTML
-    driver_standings_html = ""
-    if standings['drivers']:
-        driver_standings_html = """
-        <div class="driver-standings">
-            <h3>Driver Standings</h3>"""
-        for i, driver in enumerate(standings['drivers'], 1):
-            driver_standings_html += f"""
-            <div class="standing-item">
-                <span class="position">{i}</span>
-                <span class="name">{driver['name']}</span>
-                <span class="points">{driver['points']}</span>
-            </div>"""
-        driver_standings_html += "\n        </div>"
-    
-    # Generate constructor standings HTML  
-    constructor_standings_html = ""
-    if standings['constructors']:
-        constructor_standings_html = """
-        <div class="constructor-standings">
-            <h3>Constructor Standings</h3>"""
-        for i, constructor in enumerate(standings['constructors'], 1):
-            constructor_standings_html += f"""
-            <div class="standing-item">
-                <span class="position">{i}</span>
-                <span class="name">{constructor['name']}</span>
-                <span class="points">{constructor['points']}</span>
-            </div>"""
-        constructor_standings_html += "\n        </div>"
-    
-    # Generate the complete HTML
-    html_content = f"""<!DOCTYPE html>
-<html lang="en">
-<head>
-    <meta charset="UTF-8">
-    <meta name="viewport" content="width=device-width, initial-scale=1.0">
-    <title>F1 Dashboard - Test</title>
-    <style>{css_content}</style>
-</head>
-<body>
-    <div class="container">
-        <header>
-            <h1>Formula 1 Dashboard</h1>
-            <div class="last-updated">
-                Test simulation - {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}
-            </div>
-        </header>
-
-        <main>
-            <!-- Next Event Section -->
-            <section class="next-event">
-                <h2>Next Event</h2>
-                <div class="event-card">
-                    <h3>{next_event['name'] if next_event else 'No upcoming event'}</h3>
-                    {"<div class='event-details'>" if next_event else ""}
-                        {"<div class='event-location'>" + next_event['location'] + "</div>" if next_event else ""}
-                        {"<div class='event-date'>" + next_event['date'] + "</div>" if next_event else ""}
-                        {"<div class='event-time'>" + next_event['time'] + "</div>" if next_event else ""}
-                        {"<div class='event-type'>" + next_event['type'] + "</div>" if next_event else ""}
-                    {"</div>" if next_event else ""}
-                </div>
-            </section>
-
-            <!-- Standings Section -->
-            <section class="standings">
-                <div class="standings-grid">
-                    {driver_standings_html}
-                    {constructor_standings_html}
-                </div>
-            </section>
-        </main>
-    </div>
-</body>
-</html>"""
+    html_content = render_test_dashboard(
+        'static/css/style.css',
+        title='F1 Dashboard - Test',
+        subtitle='Test simulation',
+        next_event=next_event,
+        standings=standings
+    )
     
     # Save to file
     test_file = 'test_dashboard.html'
@@ -240,7 +190,6 @@ def main():
         import http.server
         import socketserver
         import webbrowser
-        import threading
         
         port = 8000
         handler = http.server.SimpleHTTPRequestHandler
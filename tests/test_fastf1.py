@@ -2,13 +2,35 @@
 
 import fastf1
 import pandas as pd
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timezone
 
 # Enable cache
 fastf1.Cache.enable_cache('../cache')
 
+DATE_COLS = [f'Session{i}DateUtc' for i in range(1, 6)]
+
+
+def to_utc(col):
+    """Make a session date column UTC-aware, localizing naive datetimes without reparsing."""
+    if pd.api.types.is_datetime64_dtype(col):
+        return col.dt.tz_localize('UTC')
+    return pd.to_datetime(col, utc=True)
+
+
+def after(col, ts):
+    """Mask of col > ts, compared as raw int64 epoch values (NaT is int64 min, so never after)."""
+    ts_i8 = ts.tz_convert(None).to_datetime64().astype(f'datetime64[{col.dt.unit}]').view('i8')
+    return col.array.asi8 > ts_i8
+
+
+# Fetch every schedule we might look at up front; the downloads are network-bound so overlap them
+YEARS = [2024, 2025, 2026]
+with ThreadPoolExecutor(max_workers=len(YEARS)) as executor:
+    schedule_futures = {year: executor.submit(fastf1.get_event_schedule, year) for year in YEARS}
+
 # Get current year schedule
-schedule = fastf1.get_event_schedule(2024)  # Let's try 2024 which has completed data
+schedule = schedule_futures[2024].result()  # Let's try 2024 which has completed data
 print("Schedule columns:", schedule.columns.tolist())
 
 # Filter out testing and show only race events
@@ -28,11 +50,10 @@ print(f"\nNow timestamp: {now}")
 
 try:
     # Convert datetime columns to proper timezone-aware timestamps
-    for col in ['Session1DateUtc', 'Session2DateUtc', 'Session3DateUtc', 'Session4DateUtc', 'Session5DateUtc']:
-        race_events[col] = pd.to_datetime(race_events[col], utc=True)
+    race_events[DATE_COLS] = race_events[DATE_COLS].apply(to_utc)
     
     # Filter for future events
-    upcoming = race_events[race_events['Session5DateUtc'] > now]
+    upcoming = race_events[after(race_events['Session5DateUtc'], now)]
     print(f"Upcoming race events: {len(upcoming)}")
     
     if not upcoming.empty:
@@ -44,14 +65,13 @@ try:
         # Let's also check 2025 and 2026
         for year in [2025, 2026]:
             try:
-                future_schedule = fastf1.get_event_schedule(year)
+                future_schedule = schedule_futures[year].result()
                 future_races = future_schedule[future_schedule['EventFormat'] != 'testing'].copy()
                 if not future_races.empty:
                     # Convert datetime columns
-                    for col in ['Session1DateUtc', 'Session2DateUtc', 'Session3DateUtc', 'Session4DateUtc', 'Session5DateUtc']:
-                        future_races[col] = pd.to_datetime(future_races[col], utc=True)
+                    future_races[DATE_COLS] = future_races[DATE_COLS].apply(to_utc)
                     
-                    upcoming_future = future_races[future_races['Session5DateUtc'] > now]
+                    upcoming_future = future_races[after(future_races['Session5DateUtc'], now)]
                     print(f"Upcoming races in {year}: {len(upcoming_future)}")
                     if not upcoming_future.empty:
                         next_race = upcoming_future.iloc[0]
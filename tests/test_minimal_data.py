@@ -9,27 +9,7 @@ import os
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
 
 from src.data import F1DataFetcher
-
-# First, let's see the current cache size
-def get_directory_size(path):
-    """Get the size of a directory in bytes."""
-    total = 0
-    if not os.path.exists(path):
-        return 0
-    for entry in os.scandir(path):
-        if entry.is_file():
-            total += entry.stat().st_size
-        elif entry.is_dir():
-            total += get_directory_size(entry.path)
-    return total
-
-def format_size(size_bytes):
-    """Format bytes as human readable."""
-    for unit in ['B', 'KB', 'MB', 'GB']:
-        if size_bytes < 1024.0:
-            return f"{size_bytes:.1f} {unit}"
-        size_bytes /= 1024.0
-    return f"{size_bytes:.1f} TB"
+from cache_manager import get_directory_size, format_size
 
 print("=== BEFORE: Current cache size ===")
 old_cache_size = get_directory_size('../cache')